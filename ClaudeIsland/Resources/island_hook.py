@@ -0,0 +1,477 @@
+"""
+Claude Island Hook — shared implementation for Cursor IDE and Pi Coding Agent
+- Imported by cursor-island-state.py and pi-island-state.py, which pick the agent
+- Both agents use camelCase events; only session/cwd/transcript extraction differs
+- Sends normalized session state to ClaudeIsland.app via Unix socket
+- Fire-and-forget only
+- MUST be fully resilient: never write to stderr, always exit 0
+"""
+import os
+
+# Suppress ALL stderr output at the fd level, without a Python file object.
+# fd 2 is redirected rather than closed so a socket opened later can't reuse it.
+try:
+    _devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(_devnull, 2)
+    os.close(_devnull)
+except Exception:
+    pass
+
+SOCKET_PATH = "/tmp/claude-island.sock"
+DGRAM_SOCKET_PATH = "/tmp/claude-island-dgram.sock"
+DGRAM_BUFFER_BYTES = 131072  # must match HookSocketServer.datagramBufferSize
+# Largest payload sent, a few KB under one datagram's room so it never fails on
+# per-packet overhead
+DGRAM_MAX_BYTES = DGRAM_BUFFER_BYTES - 4096
+# Stream fallback, and how long a full datagram queue is retried; matches the
+# app's 0.5 s read window so a stuck app can't stall the IDE for long
+TIMEOUT_SECONDS = 0.5
+DGRAM_RETRY_SECONDS = 0.01
+# Hook payloads are well under this, so stdin is normally one read() plus EOF
+READ_CHUNK_BYTES = 65536
+
+# Map hook event names to status
+EVENT_STATUS = {
+    "beforeSubmitPrompt": "processing",
+    "preToolUse": "running_tool",
+    "postToolUse": "processing",
+    "stop": "waiting_for_input",
+    "subagentStop": "waiting_for_input",
+    "sessionStart": "waiting_for_input",
+    "sessionEnd": "ended",
+    "preCompact": "compacting",
+}
+
+# Events that carry tool_name / tool_input / tool_use_id
+TOOL_EVENTS = ("preToolUse", "postToolUse")
+
+# json and socket are imported on first use (_import_json, send_event), so
+# stdin with no JSON object in it exits without loading either.
+# The codec objects are reused across calls; compact separators also keep
+# whitespace off the wire.
+json = None
+_DECODER = None
+_ENCODE = None
+_QUOTE = None
+
+# Events without tool fields are filled straight into bytes with pre-quoted values
+# (same output as _ENCODE), so no intermediate str of the whole object is built
+_PLAIN_KEYS = frozenset(("session_id", "cwd", "event", "agent_type", "status", "transcript_path"))
+_PLAIN_TEMPLATE = b'{"session_id":%b,"cwd":%b,"event":%b,"agent_type":%b,"status":%b%b}'
+
+
+def _import_json():
+    """Import json and build the codec objects once."""
+    global json, _DECODER, _ENCODE, _QUOTE
+    if json is not None:
+        return
+    import json
+
+    _DECODER = json.JSONDecoder()
+    _ENCODE = json.JSONEncoder(separators=(",", ":")).encode
+    _QUOTE = json.encoder.encode_basestring_ascii
+
+
+def _quote_json(value):
+    return _QUOTE(value).encode()
+
+
+def _quote_plain(value):
+    """Quote a value fast_parse already checked: printable ASCII, no quote or backslash."""
+    return b'"' + value.encode() + b'"'
+
+
+def _encode_plain(state, quote):
+    """Fill _PLAIN_TEMPLATE; raises TypeError if a value is not a str."""
+    transcript = b""
+    if "transcript_path" in state:
+        transcript = b',"transcript_path":' + quote(state["transcript_path"])
+    return _PLAIN_TEMPLATE % (
+        quote(state["session_id"]),
+        quote(state["cwd"]),
+        quote(state["event"]),
+        quote(state["agent_type"]),
+        quote(state["status"]),
+        transcript,
+    )
+
+
+def encode_state(state, plain_ascii=False):
+    """Serialize state to bytes.
+
+    plain_ascii: every value came from fast_parse (or is a constant), so it can
+    be quoted without json.
+    """
+    if plain_ascii:
+        return _encode_plain(state, _quote_plain)
+
+    _import_json()
+    if state.keys() <= _PLAIN_KEYS:
+        try:
+            return _encode_plain(state, _quote_json)
+        except TypeError:
+            pass
+    return _ENCODE(state).encode()
+
+
+def send_event(state, plain_ascii=False):
+    """Send event to app (fire-and-forget).
+
+    One non-blocking datagram, no connect/close. Everything goes through the
+    datagram socket so events arrive in order: an oversized payload is sent
+    without its tool input (or dropped, if still too big) rather than over a
+    second channel. A full datagram queue is retried for up to TIMEOUT_SECONDS
+    instead of losing the event. The stream socket, also bounded by
+    TIMEOUT_SECONDS, is only used when the app has no datagram socket (older
+    app versions), in which case it is the only channel.
+    """
+    try:
+        payload = encode_state(state, plain_ascii)
+        if len(payload) > DGRAM_MAX_BYTES:
+            slim = {k: v for k, v in state.items() if k not in ("tool_input", "tool_input_raw")}
+            payload = encode_state(slim, plain_ascii)
+    except Exception:
+        return
+    if len(payload) > DGRAM_MAX_BYTES:
+        return
+
+    import errno
+    import socket
+    import time
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, DGRAM_BUFFER_BYTES)
+            for _ in range(int(TIMEOUT_SECONDS / DGRAM_RETRY_SECONDS)):
+                try:
+                    sock.sendto(payload, socket.MSG_DONTWAIT, DGRAM_SOCKET_PATH)
+                    return
+                except OSError as e:
+                    # Queue full: EAGAIN on Linux, ENOBUFS on macOS. Anything
+                    # else (e.g. no socket bound) is handled below
+                    if e.errno not in (errno.EAGAIN, errno.ENOBUFS):
+                        raise
+                time.sleep(DGRAM_RETRY_SECONDS)
+        return
+    except (FileNotFoundError, ConnectionRefusedError):
+        # No datagram socket bound: an app that only listens on the stream
+        pass
+    except Exception:
+        return
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(TIMEOUT_SECONDS)
+            sock.connect(SOCKET_PATH)
+            sock.sendall(payload)
+    except Exception:
+        pass
+
+
+def read_input():
+    """Read all of stdin as bytes straight from fd 0, bypassing sys.stdin's layers."""
+    chunks = []
+    while True:
+        chunk = os.read(0, READ_CHUNK_BYTES)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+_WHITESPACE = " \t\r\n"
+# Top-level strings the hook reads from a tool-less event
+_FAST_KEYS = ("hook_event_name", "conversation_id", "session_id", "cwd", "transcript_path")
+
+
+def _skip_whitespace(text, i):
+    while i < len(text) and text[i] in _WHITESPACE:
+        i += 1
+    return i
+
+
+def _skip_digits(text, i):
+    while i < len(text) and "0" <= text[i] <= "9":
+        i += 1
+    return i
+
+
+def _scan_value(text, i, scanstring):
+    """Parse the non-object JSON value at text[i]; returns (value, end).
+
+    Follows json's grammar, so anything json rejects raises here too.
+    NaN/Infinity are rejected as well; the caller falls back to json for them.
+    """
+    c = text[i : i + 1]
+    if c == '"':
+        return scanstring(text, i + 1)
+    if c == "[":
+        items = []
+        i = _skip_whitespace(text, i + 1)
+        if text[i : i + 1] == "]":
+            return items, i + 1
+        while True:
+            value, i = _scan_value(text, i, scanstring)
+            items.append(value)
+            i = _skip_whitespace(text, i)
+            c = text[i : i + 1]
+            if c == "]":
+                return items, i + 1
+            if c != ",":
+                raise ValueError(i)
+            i = _skip_whitespace(text, i + 1)
+    for literal, value in (("true", True), ("false", False), ("null", None)):
+        if text.startswith(literal, i):
+            return value, i + len(literal)
+
+    # -?(0|[1-9][0-9]*)(.[0-9]+)?([eE][-+]?[0-9]+)?, converted the way json does
+    start = i
+    if text[i : i + 1] == "-":
+        i += 1
+    if text[i : i + 1] == "0":
+        i += 1
+    else:
+        end = _skip_digits(text, i)
+        if end == i:
+            raise ValueError(i)
+        i = end
+    integer = True
+    if text[i : i + 1] == ".":
+        end = _skip_digits(text, i + 1)
+        if end == i + 1:
+            raise ValueError(i)
+        i, integer = end, False
+    if text[i : i + 1] in ("e", "E"):
+        j = i + 2 if text[i + 1 : i + 2] in ("-", "+") else i + 1
+        end = _skip_digits(text, j)
+        if end == j:
+            raise ValueError(i)
+        i, integer = end, False
+    number = text[start:i]
+    return (int(number) if integer else float(number)), i
+
+
+def _parse_flat(body):
+    """Parse a stripped single-brace object exactly as json would, or return None."""
+    # json's C string scanner; unlike the json package it doesn't import re
+    from _json import scanstring
+
+    text = body.decode("utf-8")
+    fields = {}
+    i = _skip_whitespace(text, 1)
+    if text[i] != "}":
+        while True:
+            if text[i : i + 1] != '"':
+                return None
+            key, i = scanstring(text, i + 1)
+            i = _skip_whitespace(text, i)
+            if text[i : i + 1] != ":":
+                return None
+            value, i = _scan_value(text, _skip_whitespace(text, i + 1), scanstring)
+            fields[key] = value
+            i = _skip_whitespace(text, i)
+            if text[i : i + 1] == "}":
+                break
+            if text[i : i + 1] != ",":
+                return None
+            i = _skip_whitespace(text, i + 1)
+    if i != len(text) - 1:
+        return None
+    return fields
+
+
+def _is_plain(value):
+    """A str _quote_plain can emit as is: printable ASCII, no quote or backslash."""
+    return (
+        isinstance(value, str)
+        and value.isascii()
+        and value.isprintable()
+        and '"' not in value
+        and "\\" not in value
+    )
+
+
+def fast_parse(raw):
+    """Canonical-shape fast path for events without tool fields.
+
+    Cursor and Pi send a flat object. It is parsed without the json package
+    (and the re module it imports): strings go through json's own C scanner,
+    the rest through a small walker of the same grammar, so input json
+    rejects is rejected here too. Only a single bare object qualifies: with
+    one brace pair nothing is nested. Anything else (nested objects, braces
+    in strings, truncated or trailing input), tool events, which carry a
+    nested tool_input, and values that aren't plain printable ASCII return
+    None to fall back to parse_input.
+    """
+    body = raw.strip()
+    if body[:1] != b"{" or body[-1:] != b"}" or body.count(b"{") != 1:
+        return None
+    try:
+        fields = _parse_flat(body)
+    except Exception:
+        return None
+    if fields is None:
+        return None
+
+    event = fields.get("hook_event_name")
+    if not _is_plain(event) or event in TOOL_EVENTS:
+        return None
+
+    data = {}
+    for key in _FAST_KEYS:
+        if key in fields:
+            if not _is_plain(fields[key]):
+                return None
+            data[key] = fields[key]
+
+    if "workspace_roots" in fields:
+        roots = fields["workspace_roots"]
+        if not isinstance(roots, list) or (roots and not _is_plain(roots[0])):
+            return None
+        if roots:
+            data["workspace_roots"] = roots[:1]
+    return data
+
+
+def parse_input(raw):
+    """Best-effort JSON extraction from potentially malformed stdin (bytes)."""
+    # No object anywhere (empty stdin, stray text): nothing to parse, and no
+    # reason to import json
+    start = raw.find(b"{")
+    if start < 0:
+        return None
+
+    _import_json()
+
+    # 1. Try direct parse
+    try:
+        return json.loads(raw)
+    except Exception:
+        pass
+
+    # Repair stages stay on bytes (no decode copy)
+
+    # 2. Extract the outermost { ... } and try parsing that
+    end = raw.rfind(b"}")
+    if end > start:
+        try:
+            return json.loads(raw[start : end + 1])
+        except Exception:
+            pass
+
+    # 3. Stop at the end of the first complete object, dropping trailing garbage
+    #    (extra paths, stray braces). raw_decode scans in C but only takes str.
+    try:
+        return _DECODER.raw_decode(raw[start:].decode("utf-8", errors="replace"))[0]
+    except Exception:
+        pass
+
+    return None
+
+
+def _session_cursor(data):
+    """Cursor format: conversation_id, workspace_roots, .txt transcript_path."""
+    session_id = data.get("conversation_id") or data.get("session_id") or "unknown"
+    workspace_roots = data.get("workspace_roots") or []
+    cwd = workspace_roots[0] if workspace_roots else ""
+
+    # Extract transcript path from Cursor hook data, use JSONL version
+    transcript_path = data.get("transcript_path", "")
+    if transcript_path and transcript_path.endswith(".txt"):
+        transcript_path = transcript_path[:-4] + ".jsonl"
+
+    return session_id, cwd, transcript_path
+
+
+def _session_pi(data):
+    """Pi format: session_id is the full JSONL file path, workspace_roots has cwd."""
+    raw_session_id = data.get("session_id") or ""
+    workspace_roots = data.get("workspace_roots") or []
+    cwd = data.get("cwd") or (workspace_roots[0] if workspace_roots else "")
+
+    # Pi sends session_id as the full file path to the JSONL session file.
+    # Extract the UUID from the filename (format: <timestamp>_<uuid>.jsonl)
+    # and pass the full path as transcript_path.
+    transcript_path = ""
+    session_id = raw_session_id
+    if raw_session_id and "/" in raw_session_id:
+        transcript_path = raw_session_id
+        basename = os.path.basename(raw_session_id)
+        # Strip .jsonl extension
+        if basename.endswith(".jsonl"):
+            basename = basename[:-6]
+        # Extract UUID after the timestamp prefix (timestamp_uuid)
+        parts = basename.split("_", 1)
+        if len(parts) == 2:
+            session_id = parts[1]
+        else:
+            session_id = basename
+
+    if not session_id or session_id == "ephemeral":
+        session_id = "unknown"
+
+    return session_id, cwd, transcript_path
+
+
+SESSION_EXTRACTORS = {
+    "cursor": _session_cursor,
+    "pi": _session_pi,
+}
+
+
+def handle_event(agent_type):
+    try:
+        raw = read_input()
+    except Exception:
+        return
+
+    data = fast_parse(raw)
+    plain_ascii = data is not None
+    if data is None:
+        data = parse_input(raw)
+        if data is None:
+            return
+
+    session_id, cwd, transcript_path = SESSION_EXTRACTORS[agent_type](data)
+    event = data.get("hook_event_name", "")
+
+    # Build state object
+    state = {
+        "session_id": session_id,
+        "cwd": cwd,
+        "event": event,
+        "agent_type": agent_type,
+        "status": EVENT_STATUS.get(event, "unknown"),
+    }
+
+    if transcript_path:
+        state["transcript_path"] = transcript_path
+
+    # Extract tool_use_id for tool tracking
+    tool_use_id = data.get("tool_use_id", "")
+
+    if event in TOOL_EVENTS:
+        state["tool"] = data.get("tool_name")
+        tool_input = data.get("tool_input", {})
+        if isinstance(tool_input, str):
+            # JSON-encoded string: forwarded untouched, the app decodes it
+            # (HookEvent.init(from:)) instead of this hook parsing and
+            # re-serializing the largest field of the payload
+            state["tool_input_raw"] = tool_input
+        else:
+            state["tool_input"] = tool_input
+        if tool_use_id:
+            state["tool_use_id"] = tool_use_id
+        if state.get("tool") == "Shell":
+            state["tool_display"] = "Bash"
+
+    send_event(state, plain_ascii)
+
+
+def main(agent_type):
+    """Hook entry point for the given agent ("cursor" or "pi"); never raises."""
+    try:
+        handle_event(agent_type)
+        os.write(1, b"{}\n")
+    except Exception:
+        pass
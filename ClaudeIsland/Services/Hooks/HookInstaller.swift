@@ -26,6 +26,17 @@ struct HookInstaller {
     private static let piHookScriptsDirName = "hook-scripts"
     private static let piScriptName = "pi-island-state.py"
 
+    // Shared implementation imported by the Cursor and Pi scripts; copied next to each
+    private static let hookModuleName = "island_hook.py"
+
+    // Resolved once per launch; shared by all three config writers
+    private static let python = detectPython()
+
+    // Cursor/Pi hooks only need the stdlib: -S skips site (site-packages and .pth
+    // scanning), -E ignores PYTHON* variables. Not -I, which would also drop the
+    // script directory that island_hook.py is imported from.
+    private static let fireAndForgetFlags = "-S -E"
+
     /// Install hook scripts and update both config files on app launch
     static func installIfNeeded() {
         let claudeDir = FileManager.default.homeDirectoryForCurrentUser
@@ -33,6 +44,7 @@ struct HookInstaller {
         let hooksDir = claudeDir.appendingPathComponent(hooksDirName)
         let claudeScript = hooksDir.appendingPathComponent(claudeScriptName)
         let cursorScript = hooksDir.appendingPathComponent(cursorScriptName)
+        let hookModule = hooksDir.appendingPathComponent(hookModuleName)
         let settingsJSON = claudeDir.appendingPathComponent(settingsJSONName)
         let hooksJSON = claudeDir.appendingPathComponent(hooksJSONName)
 
@@ -42,24 +54,11 @@ struct HookInstaller {
         )
 
         // Copy Claude Code hook script
-        if let bundled = Bundle.main.url(forResource: "claude-island-state", withExtension: "py") {
-            try? FileManager.default.removeItem(at: claudeScript)
-            try? FileManager.default.copyItem(at: bundled, to: claudeScript)
-            try? FileManager.default.setAttributes(
-                [.posixPermissions: 0o755],
-                ofItemAtPath: claudeScript.path
-            )
-        }
+        copyBundledScript("claude-island-state", to: claudeScript)
 
-        // Copy Cursor hook script
-        if let bundled = Bundle.main.url(forResource: "cursor-island-state", withExtension: "py") {
-            try? FileManager.default.removeItem(at: cursorScript)
-            try? FileManager.default.copyItem(at: bundled, to: cursorScript)
-            try? FileManager.default.setAttributes(
-                [.posixPermissions: 0o755],
-                ofItemAtPath: cursorScript.path
-            )
-        }
+        // Copy Cursor hook script and the module it imports
+        copyBundledScript("cursor-island-state", to: cursorScript)
+        copyBundledScript("island_hook", to: hookModule, permissions: 0o644)
 
         // Copy Pi hook script
         let piAgentDir = FileManager.default.homeDirectoryForCurrentUser
@@ -67,6 +66,7 @@ struct HookInstaller {
             .appendingPathComponent(piAgentDirName)
         let piHookScriptsDir = piAgentDir.appendingPathComponent(piHookScriptsDirName)
         let piScript = piHookScriptsDir.appendingPathComponent(piScriptName)
+        let piHookModule = piHookScriptsDir.appendingPathComponent(hookModuleName)
         let piHooksJSON = piAgentDir.appendingPathComponent(hooksJSONName)
 
         if FileManager.default.fileExists(atPath: piAgentDir.path) {
@@ -75,14 +75,8 @@ struct HookInstaller {
                 withIntermediateDirectories: true
             )
 
-            if let bundled = Bundle.main.url(forResource: "pi-island-state", withExtension: "py") {
-                try? FileManager.default.removeItem(at: piScript)
-                try? FileManager.default.copyItem(at: bundled, to: piScript)
-                try? FileManager.default.setAttributes(
-                    [.posixPermissions: 0o755],
-                    ofItemAtPath: piScript.path
-                )
-            }
+            copyBundledScript("pi-island-state", to: piScript)
+            copyBundledScript("island_hook", to: piHookModule, permissions: 0o644)
 
             updatePiHooksJSON(at: piHooksJSON)
         }
@@ -91,6 +85,18 @@ struct HookInstaller {
         updateCursorHooksJSON(at: hooksJSON)
     }
 
+    /// Replace `destination` with the bundled `<resource>.py`. Entry scripts are made
+    /// executable; pass 0o644 for an imported module.
+    private static func copyBundledScript(_ resource: String, to destination: URL, permissions: Int = 0o755) {
+        guard let bundled = Bundle.main.url(forResource: resource, withExtension: "py") else { return }
+        try? FileManager.default.removeItem(at: destination)
+        try? FileManager.default.copyItem(at: bundled, to: destination)
+        try? FileManager.default.setAttributes(
+            [.posixPermissions: permissions],
+            ofItemAtPath: destination.path
+        )
+    }
+
     // MARK: - Claude Code CLI: settings.json (PascalCase, nested format)
 
     private static func updateClaudeSettings(at settingsURL: URL) {
@@ -100,7 +106,6 @@ struct HookInstaller {
             json = existing
         }
 
-        let python = detectPython()
         let command = "\(python) ~/.claude/hooks/\(claudeScriptName)"
         let hookEntry: [[String: Any]] = [["type": "command", "command": command]]
         let withMatcher: [[String: Any]] = [["matcher": "*", "hooks": hookEntry]]
@@ -124,26 +129,37 @@ struct HookInstaller {
             ("PreCompact", preCompactConfig),
         ]
 
+        var changed = false
         for (event, config) in hookEvents {
-            if var existingEvent = hooks[event] as? [[String: Any]] {
-                let hasOurHook = existingEvent.contains { entry in
-                    if let entryHooks = entry["hooks"] as? [[String: Any]] {
-                        return entryHooks.contains { h in
-                            let cmd = h["command"] as? String ?? ""
-                            return cmd.contains("claude-island-state.py")
-                        }
-                    }
-                    return false
+            let existingEvent = hooks[event] as? [[String: Any]] ?? []
+            let ours: [String] = existingEvent.flatMap { entry in
+                (entry["hooks"] as? [[String: Any]] ?? []).compactMap { h -> String? in
+                    let cmd = h["command"] as? String ?? ""
+                    return cmd.contains("claude-island-state.py") ? cmd : nil
                 }
-                if !hasOurHook {
-                    existingEvent.append(contentsOf: config)
-                    hooks[event] = existingEvent
+            }
+            // Leave the event (and its ordering) alone when our hooks are current
+            if ours.count == config.count && ours.allSatisfy({ $0 == command }) {
+                continue
+            }
+            // Drop only our hook from each matcher group so hooks the user added to
+            // the same group survive; a group is removed only once it is empty
+            let kept: [[String: Any]] = existingEvent.compactMap { entry in
+                guard let entryHooks = entry["hooks"] as? [[String: Any]] else { return entry }
+                let others = entryHooks.filter { h in
+                    !(h["command"] as? String ?? "").contains("claude-island-state.py")
                 }
-            } else {
-                hooks[event] = config
+                if others.count == entryHooks.count { return entry }
+                if others.isEmpty { return nil }
+                var group = entry
+                group["hooks"] = others
+                return group
             }
+            hooks[event] = kept + config
+            changed = true
         }
 
+        guard changed else { return }
         json["hooks"] = hooks
 
         if let data = try? JSONSerialization.data(
@@ -166,8 +182,7 @@ struct HookInstaller {
             hooks = existingHooks
         }
 
-        let python = detectPython()
-        let command = "\(python) ~/.claude/hooks/\(cursorScriptName)"
+        let command = "\(python) \(fireAndForgetFlags) ~/.claude/hooks/\(cursorScriptName)"
 
         let hookEvents = [
             "beforeSubmitPrompt",
@@ -180,17 +195,25 @@ struct HookInstaller {
             "preCompact",
         ]
 
+        var changed = false
         for event in hookEvents {
             var entries = hooks[event] as? [[String: Any]] ?? []
-            let hasOurHook = entries.contains { entry in
-                (entry["command"] as? String)?.contains("cursor-island-state.py") == true
+            let ours = entries.compactMap { entry -> String? in
+                let cmd = entry["command"] as? String ?? ""
+                return cmd.contains("cursor-island-state.py") ? cmd : nil
             }
-            if !hasOurHook {
-                entries.append(["command": command])
-                hooks[event] = entries
+            // Leave the event (and its ordering) alone when our entry is current
+            if ours == [command] { continue }
+            // Replace our entry so a changed interpreter path is picked up
+            entries.removeAll { entry in
+                (entry["command"] as? String)?.contains("cursor-island-state.py") == true
             }
+            entries.append(["command": command])
+            hooks[event] = entries
+            changed = true
         }
 
+        guard changed else { return }
         json["hooks"] = hooks
 
         if let data = try? JSONSerialization.data(
@@ -213,8 +236,7 @@ struct HookInstaller {
             hooks = existingHooks
         }
 
-        let python = detectPython()
-        let command = "\(python) ~/.pi/agent/hook-scripts/\(piScriptName)"
+        let command = "\(python) \(fireAndForgetFlags) ~/.pi/agent/hook-scripts/\(piScriptName)"
 
         let hookEvents = [
             "beforeSubmitPrompt",
@@ -227,23 +249,28 @@ struct HookInstaller {
             "preCompact",
         ]
 
+        var changed = false
         for event in hookEvents {
             var entries = hooks[event] as? [[String: Any]] ?? []
-            // Remove stale cursor-island-state entries from pi config
-            entries.removeAll { entry in
-                (entry["command"] as? String)?.contains("cursor-island-state.py") == true
-            }
-            let hasOurHook = entries.contains { entry in
-                (entry["command"] as? String)?.contains("pi-island-state.py") == true
+            let ours = entries.compactMap { entry -> String? in
+                let cmd = entry["command"] as? String ?? ""
+                return cmd.contains("cursor-island-state.py") || cmd.contains("pi-island-state.py")
+                    ? cmd : nil
             }
-            if !hasOurHook {
-                entries.append(["command": command])
-                hooks[event] = entries
-            } else {
-                hooks[event] = entries
+            // Leave the event (and its ordering) alone when our entry is current
+            if ours == [command] { continue }
+            // Remove stale cursor-island-state entries from pi config, and our own
+            // entry so a changed interpreter path is picked up
+            entries.removeAll { entry in
+                let cmd = entry["command"] as? String ?? ""
+                return cmd.contains("cursor-island-state.py") || cmd.contains("pi-island-state.py")
             }
+            entries.append(["command": command])
+            hooks[event] = entries
+            changed = true
         }
 
+        guard changed else { return }
         json["hooks"] = hooks
 
         if let data = try? JSONSerialization.data(
@@ -340,8 +367,11 @@ struct HookInstaller {
         // Remove scripts
         let claudeScript = hooksDir.appendingPathComponent(claudeScriptName)
         let cursorScript = hooksDir.appendingPathComponent(cursorScriptName)
+        let hookModule = hooksDir.appendingPathComponent(hookModuleName)
         try? FileManager.default.removeItem(at: claudeScript)
         try? FileManager.default.removeItem(at: cursorScript)
+        try? FileManager.default.removeItem(at: hookModule)
+        removeCompiledHookModule(in: hooksDir)
 
         // Clean hooks.json (Cursor)
         let hooksJSON = claudeDir.appendingPathComponent(hooksJSONName)
@@ -357,12 +387,34 @@ struct HookInstaller {
             .appendingPathComponent(piAgentDirName)
         let piHookScriptsDir = piAgentDir.appendingPathComponent(piHookScriptsDirName)
         let piScript = piHookScriptsDir.appendingPathComponent(piScriptName)
+        let piHookModule = piHookScriptsDir.appendingPathComponent(hookModuleName)
         try? FileManager.default.removeItem(at: piScript)
+        try? FileManager.default.removeItem(at: piHookModule)
+        removeCompiledHookModule(in: piHookScriptsDir)
 
         let piHooksJSON = piAgentDir.appendingPathComponent(hooksJSONName)
         cleanHooksJSON(at: piHooksJSON, scriptName: piScriptName)
     }
 
+    /// Python caches the imported hook module as __pycache__/island_hook.<tag>.pyc;
+    /// remove those and the cache directory itself once nothing else is left in it
+    private static func removeCompiledHookModule(in dir: URL) {
+        let fileManager = FileManager.default
+        let cacheDir = dir.appendingPathComponent("__pycache__")
+        guard let names = try? fileManager.contentsOfDirectory(atPath: cacheDir.path) else {
+            return
+        }
+
+        let prefix = (hookModuleName as NSString).deletingPathExtension + "."
+        for name in names where name.hasPrefix(prefix) && name.hasSuffix(".pyc") {
+            try? fileManager.removeItem(at: cacheDir.appendingPathComponent(name))
+        }
+
+        if (try? fileManager.contentsOfDirectory(atPath: cacheDir.path))?.isEmpty == true {
+            try? fileManager.removeItem(at: cacheDir)
+        }
+    }
+
     private static func cleanHooksJSON(at url: URL, scriptName: String) {
         guard let data = try? Data(contentsOf: url),
               var json = try? JSONSerialization.jsonObject(with: data) as? [String: Any],
@@ -432,21 +484,15 @@ struct HookInstaller {
         }
     }
 
-    private static func detectPython() -> String {
-        let process = Process()
-        process.executableURL = URL(fileURLWithPath: "/usr/bin/which")
-        process.arguments = ["python3"]
-        process.standardOutput = FileHandle.nullDevice
-        process.standardError = FileHandle.nullDevice
-
-        do {
-            try process.run()
-            process.waitUntilExit()
-            if process.terminationStatus == 0 {
-                return "python3"
-            }
-        } catch {}
+    /// Stable links to a real python3 (Homebrew on Apple silicon, then Intel Homebrew and
+    /// python.org installers). Checked in this fixed order so the chosen interpreter doesn't
+    /// depend on the PATH the app happened to be launched with.
+    private static let pythonCandidates = ["/opt/homebrew/bin/python3", "/usr/local/bin/python3"]
 
-        return "python"
+    /// Use the first installed candidate, which skips the /usr/bin/python3 xcrun stub on every
+    /// hook fire. Nothing is executed here: without Command Line Tools the stub pops the install
+    /// dialog. Otherwise keep the bare name and let the agent's PATH resolve it.
+    private static func detectPython() -> String {
+        pythonCandidates.first { FileManager.default.isExecutableFile(atPath: $0) } ?? "python3"
     }
 }
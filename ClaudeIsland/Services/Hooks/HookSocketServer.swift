@@ -78,6 +78,40 @@ struct HookEvent: Codable, Sendable {
     }
 }
 
+extension HookEvent {
+    private enum RawCodingKeys: String, CodingKey {
+        case toolInputRaw = "tool_input_raw"
+    }
+
+    /// Decoder for `tool_input_raw`, shared rather than built per event
+    /// (nonisolated static for cross-context access)
+    private nonisolated static let rawToolInputDecoder = JSONDecoder()
+
+    /// Cursor/Pi hooks forward a string-encoded tool_input untouched as `tool_input_raw`
+    /// rather than parsing it in the hook; it is decoded into `toolInput` here
+    nonisolated init(from decoder: Decoder) throws {
+        let container = try decoder.container(keyedBy: CodingKeys.self)
+        sessionId = try container.decode(String.self, forKey: .sessionId)
+        cwd = try container.decode(String.self, forKey: .cwd)
+        event = try container.decode(String.self, forKey: .event)
+        status = try container.decode(String.self, forKey: .status)
+        tool = try container.decodeIfPresent(String.self, forKey: .tool)
+        toolDisplay = try container.decodeIfPresent(String.self, forKey: .toolDisplay)
+        toolUseId = try container.decodeIfPresent(String.self, forKey: .toolUseId)
+        agentType = try container.decodeIfPresent(AgentType.self, forKey: .agentType)
+        transcriptPath = try container.decodeIfPresent(String.self, forKey: .transcriptPath)
+
+        if let input = try container.decodeIfPresent([String: AnyCodable].self, forKey: .toolInput) {
+            toolInput = input
+        } else if let raw = try decoder.container(keyedBy: RawCodingKeys.self)
+                    .decodeIfPresent(String.self, forKey: .toolInputRaw) {
+            toolInput = try? Self.rawToolInputDecoder.decode([String: AnyCodable].self, from: Data(raw.utf8))
+        } else {
+            toolInput = nil
+        }
+    }
+}
+
 /// Callback for hook events
 typealias HookEventHandler = @Sendable (HookEvent) -> Void
 
@@ -85,11 +119,28 @@ typealias HookEventHandler = @Sendable (HookEvent) -> Void
 class HookSocketServer {
     static let shared = HookSocketServer()
     static let socketPath = "/tmp/claude-island.sock"
+    /// Datagram socket for fire-and-forget hooks (Cursor, Pi): one packet per event, no connect/accept
+    static let datagramSocketPath = "/tmp/claude-island-dgram.sock"
+    /// Largest datagram accepted; hook scripts drop tool_input from larger events rather than
+    /// switching to the stream socket, so datagram events keep their order
+    static let datagramBufferSize: Int32 = 131072
+    /// Kernel receive queue for the datagram socket. It also holds each sender's address, so
+    /// it is sized for a burst of full-size events (a large preToolUse and its postToolUse)
+    static let datagramReceiveQueueSize: Int32 = 2 * 1024 * 1024
 
     private var serverSocket: Int32 = -1
     private var acceptSource: DispatchSourceRead?
+    private var datagramSocket: Int32 = -1
+    private var datagramSource: DispatchSourceRead?
+    /// Reused across wakeups; only touched on `datagramQueue`
+    private var datagramBuffer = [UInt8](repeating: 0, count: Int(HookSocketServer.datagramBufferSize))
+    /// Shared by both queues; it is never reconfigured, so concurrent decodes are safe
+    private let decoder = JSONDecoder()
     private var eventHandler: HookEventHandler?
     private let queue = DispatchQueue(label: "com.claudeisland.socket", qos: .userInitiated)
+    /// Datagrams drain here, so a stream client holding `queue` in its read loop can't
+    /// back up the datagram socket until the kernel drops events
+    private let datagramQueue = DispatchQueue(label: "com.claudeisland.socket.dgram", qos: .userInitiated)
 
     private init() {}
 
@@ -115,23 +166,7 @@ class HookSocketServer {
         let flags = fcntl(serverSocket, F_GETFL)
         _ = fcntl(serverSocket, F_SETFL, flags | O_NONBLOCK)
 
-        var addr = sockaddr_un()
-        addr.sun_family = sa_family_t(AF_UNIX)
-        Self.socketPath.withCString { ptr in
-            withUnsafeMutablePointer(to: &addr.sun_path) { pathPtr in
-                let pathBufferPtr = UnsafeMutableRawPointer(pathPtr)
-                    .assumingMemoryBound(to: CChar.self)
-                strcpy(pathBufferPtr, ptr)
-            }
-        }
-
-        let bindResult = withUnsafePointer(to: &addr) { ptr in
-            ptr.withMemoryRebound(to: sockaddr.self, capacity: 1) { sockaddrPtr in
-                bind(serverSocket, sockaddrPtr, socklen_t(MemoryLayout<sockaddr_un>.size))
-            }
-        }
-
-        guard bindResult == 0 else {
+        guard Self.bindSocket(serverSocket, to: Self.socketPath) == 0 else {
             logger.error("Failed to bind socket: \(errno)")
             close(serverSocket)
             serverSocket = -1
@@ -160,6 +195,68 @@ class HookSocketServer {
             }
         }
         acceptSource?.resume()
+
+        startDatagramServer()
+    }
+
+    private func startDatagramServer() {
+        guard datagramSocket < 0 else { return }
+
+        unlink(Self.datagramSocketPath)
+
+        datagramSocket = socket(AF_UNIX, SOCK_DGRAM, 0)
+        guard datagramSocket >= 0 else {
+            logger.error("Failed to create datagram socket: \(errno)")
+            return
+        }
+
+        let flags = fcntl(datagramSocket, F_GETFL)
+        _ = fcntl(datagramSocket, F_SETFL, flags | O_NONBLOCK)
+
+        // Default datagram receive space is a few KB; tool_input payloads are larger
+        var receiveBufferSize = Self.datagramReceiveQueueSize
+        setsockopt(datagramSocket, SOL_SOCKET, SO_RCVBUF, &receiveBufferSize, socklen_t(MemoryLayout<Int32>.size))
+
+        guard Self.bindSocket(datagramSocket, to: Self.datagramSocketPath) == 0 else {
+            logger.error("Failed to bind datagram socket: \(errno)")
+            close(datagramSocket)
+            datagramSocket = -1
+            return
+        }
+
+        chmod(Self.datagramSocketPath, 0o777)
+
+        logger.info("Listening on \(Self.datagramSocketPath, privacy: .public)")
+
+        datagramSource = DispatchSource.makeReadSource(fileDescriptor: datagramSocket, queue: datagramQueue)
+        datagramSource?.setEventHandler { [weak self] in
+            self?.drainDatagrams()
+        }
+        datagramSource?.setCancelHandler { [weak self] in
+            if let fd = self?.datagramSocket, fd >= 0 {
+                close(fd)
+                self?.datagramSocket = -1
+            }
+        }
+        datagramSource?.resume()
+    }
+
+    private static func bindSocket(_ fd: Int32, to path: String) -> Int32 {
+        var addr = sockaddr_un()
+        addr.sun_family = sa_family_t(AF_UNIX)
+        path.withCString { ptr in
+            withUnsafeMutablePointer(to: &addr.sun_path) { pathPtr in
+                let pathBufferPtr = UnsafeMutableRawPointer(pathPtr)
+                    .assumingMemoryBound(to: CChar.self)
+                strcpy(pathBufferPtr, ptr)
+            }
+        }
+
+        return withUnsafePointer(to: &addr) { ptr in
+            ptr.withMemoryRebound(to: sockaddr.self, capacity: 1) { sockaddrPtr in
+                bind(fd, sockaddrPtr, socklen_t(MemoryLayout<sockaddr_un>.size))
+            }
+        }
     }
 
     /// Stop the socket server
@@ -167,6 +264,9 @@ class HookSocketServer {
         acceptSource?.cancel()
         acceptSource = nil
         unlink(Self.socketPath)
+        datagramSource?.cancel()
+        datagramSource = nil
+        unlink(Self.datagramSocketPath)
     }
 
     private func acceptConnection() {
@@ -212,9 +312,24 @@ class HookSocketServer {
 
         defer { close(clientSocket) }
 
+        handleEventData(allData)
+    }
+
+    /// Each datagram is one complete JSON event. Everything queued since the last
+    /// wakeup is read in one pass, so a burst of hook events costs a single dispatch.
+    private func drainDatagrams() {
+        while true {
+            let bytesRead = recv(datagramSocket, &datagramBuffer, Int(Self.datagramBufferSize), 0)
+            guard bytesRead >= 0 else { return }
+
+            handleEventData(Data(datagramBuffer[0..<bytesRead]))
+        }
+    }
+
+    private func handleEventData(_ allData: Data) {
         guard !allData.isEmpty else { return }
 
-        guard let event = try? JSONDecoder().decode(HookEvent.self, from: allData) else {
+        guard let event = try? decoder.decode(HookEvent.self, from: allData) else {
             logger.warning("Failed to parse event: \(String(data: allData, encoding: .utf8) ?? "?", privacy: .public)")
             return
         }